@@ -29,6 +29,25 @@ import numpy as np
 import pandas as pd
 
 _NUM_TO_RETRIEVE_TO_CONTEXTUALIZE_IMPORTANCE = 25
+_INITIAL_EMBEDDINGS_CAPACITY = 64
+
+
+def _top_k_positions(scores: pd.Series, k: int) -> np.ndarray:
+  """Returns the positions of the k highest scores, highest first.
+
+  Only the k selected scores are sorted, so this is linear in the number of
+  scores rather than requiring a full sort.
+
+  Args:
+    scores: The scores to select from.
+    k: The number of positions to return.
+  """
+  negated_scores = -scores.to_numpy(dtype=float)
+  if k < len(negated_scores):
+    top_k = np.argpartition(negated_scores, k)[:k]
+  else:
+    top_k = np.arange(len(negated_scores))
+  return top_k[np.argsort(negated_scores[top_k], kind='stable')]
 
 
 def _check_date_in_range(timestamp: datetime.datetime) -> None:
@@ -73,11 +92,18 @@ class AssociativeMemory:
         importance or importance_function.ConstantImportanceModel().importance)
 
     self._memory_bank = pd.DataFrame(
-        columns=['text', 'time', 'tags', 'embedding', 'importance']
+        columns=['text', 'time', 'tags', 'importance']
     )
     self._clock_now = clock
     self._interval = clock_step_size
     self._stored_hashes = set()
+    # The embeddings of the memory bank rows, in order, as one contiguous
+    # float32 matrix so retrieval reads them with a single matrix-vector
+    # product. This is the only copy of the embeddings; the memory bank has no
+    # embedding column. Rows from `_num_embeddings` onwards are spare capacity,
+    # at most as many as the rows in use.
+    self._embeddings: np.ndarray | None = None
+    self._num_embeddings = 0
 
   def add(
       self,
@@ -119,15 +145,17 @@ class AssociativeMemory:
         'importance': importance,
     }
     hashed_contents = hash(tuple(contents.values()))
-    derived = {'embedding': self._embedder(text)}
-    new_df = pd.Series(contents | derived).to_frame().T.infer_objects()
+    embedding = self._embedder(text)
+    new_df = pd.Series(contents).to_frame().T.infer_objects()
 
     with self._memory_bank_lock:
       if hashed_contents in self._stored_hashes:
         return
-      self._memory_bank = pd.concat(
-          [self._memory_bank, new_df], ignore_index=True
-      )
+      memory_bank = pd.concat([self._memory_bank, new_df], ignore_index=True)
+      # Append the embedding before replacing the bank, so that a failed add
+      # leaves the bank and the embedding matrix unchanged and aligned.
+      self._append_embedding(embedding)
+      self._memory_bank = memory_bank
       self._stored_hashes.add(hashed_contents)
 
   def extend(
@@ -145,8 +173,57 @@ class AssociativeMemory:
       self.add(text, **kwargs)
 
   def get_data_frame(self) -> pd.DataFrame:
+    """Returns a copy of the memory bank, with an embedding column."""
     with self._memory_bank_lock:
-      return self._memory_bank.copy()
+      data = self._memory_bank.copy()
+      if self._num_embeddings:
+        embeddings = self._embeddings[:self._num_embeddings].copy()
+      else:
+        embeddings = []
+    data.insert(
+        data.columns.get_loc('importance'),
+        'embedding',
+        pd.Series(list(embeddings), index=data.index, dtype=object),
+    )
+    return data
+
+  def _append_embedding(self, embedding: np.ndarray) -> None:
+    """Appends an embedding to the embedding matrix.
+
+    Assumes the memory bank lock has been acquired. The matrix doubles its
+    capacity when full, so appending is amortized constant time.
+
+    Args:
+      embedding: The embedding of the memory being added to the memory bank.
+    """
+    embedding = np.asarray(embedding, dtype=np.float32)
+    if self._embeddings is None:
+      self._embeddings = np.empty(
+          (_INITIAL_EMBEDDINGS_CAPACITY, *embedding.shape), dtype=np.float32)
+    elif self._num_embeddings == len(self._embeddings):
+      self._embeddings = np.concatenate(
+          [self._embeddings, np.empty_like(self._embeddings)])
+    self._embeddings[self._num_embeddings] = embedding
+    self._num_embeddings += 1
+
+  def _get_similarities(self, x: np.ndarray) -> pd.Series:
+    """Returns the dot product of x with each stored embedding.
+
+    Assumes the memory bank lock has been acquired. All the embeddings are
+    scored with a single matrix-vector product over the float32 embedding
+    matrix.
+
+    Args:
+      x: The input vector.
+
+    Returns:
+      The similarities, indexed like the memory bank.
+    """
+    if not self._num_embeddings:
+      return pd.Series(index=self._memory_bank.index, dtype=float)
+    embeddings = self._embeddings[:self._num_embeddings]
+    similarities = embeddings @ np.asarray(x, dtype=np.float32)
+    return pd.Series(similarities, index=self._memory_bank.index, dtype=float)
 
   def _get_top_k_cosine(self, x: np.ndarray, k: int):
     """Returns the top k most cosine similar rows to an input vector x.
@@ -159,15 +236,10 @@ class AssociativeMemory:
       Rows, sorted by cosine similarity in descending order.
     """
     with self._memory_bank_lock:
-      cosine_similarities = self._memory_bank['embedding'].apply(
-          lambda y: np.dot(x, y)
-      )
+      cosine_similarities = self._get_similarities(x)
 
-      # Sort the cosine similarities in descending order.
-      cosine_similarities.sort_values(ascending=False, inplace=True)
-
-      # Return the top k rows.
-      return self._memory_bank.iloc[cosine_similarities.head(k).index]
+      # Return the top k rows, in descending order of similarity.
+      return self._memory_bank.iloc[_top_k_positions(cosine_similarities, k)]
 
   def _get_top_k_similar_rows(
       self, x, k: int, use_recency: bool = True, use_importance: bool = True
@@ -184,28 +256,22 @@ class AssociativeMemory:
       Rows, sorted by cosine similarity in descending order.
     """
     with self._memory_bank_lock:
-      cosine_similarities = self._memory_bank['embedding'].apply(
-          lambda y: np.dot(x, y)
-      )
+      cosine_similarities = self._get_similarities(x)
 
       similarity_score = cosine_similarities
 
       if use_recency:
-        max_time = self._memory_bank['time'].max()
-        discounted_time = self._memory_bank['time'].apply(
-            lambda y: 0.99 ** ((max_time - y) / datetime.timedelta(minutes=1))
-        )
+        time = self._memory_bank['time']
+        discounted_time = 0.99 ** (
+            (time.max() - time) / datetime.timedelta(minutes=1))
         similarity_score += discounted_time
 
       if use_importance:
         importance = self._memory_bank['importance']
         similarity_score += importance
 
-      # Sort the similarities in descending order.
-      similarity_score.sort_values(ascending=False, inplace=True)
-
-      # Return the top k rows.
-      return self._memory_bank.iloc[similarity_score.head(k).index]
+      # Return the top k rows, in descending order of similarity.
+      return self._memory_bank.iloc[_top_k_positions(similarity_score, k)]
 
   def _get_k_recent(self, k: int):
     with self._memory_bank_lock:
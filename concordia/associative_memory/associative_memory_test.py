@@ -0,0 +1,150 @@
+# Copyright 2024 DeepMind Technologies Limited.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for associative memory."""
+
+import datetime
+
+from absl.testing import absltest
+from concordia.associative_memory import associative_memory
+import numpy as np
+
+_EMBEDDINGS = {
+    'apple': np.array([1.0, 0.0, 0.0]),
+    'banana': np.array([0.0, 1.0, 0.0]),
+    'cherry': np.array([0.0, 0.0, 1.0]),
+    'something like an apple': np.array([0.9, 0.1, 0.0]),
+    'something like a cherry': np.array([0.1, 0.0, 0.9]),
+}
+
+
+def _embedder(text: str) -> np.ndarray:
+  return _EMBEDDINGS[text]
+
+
+def _make_memory() -> associative_memory.AssociativeMemory:
+  return associative_memory.AssociativeMemory(
+      sentence_embedder=_embedder,
+      clock=lambda: datetime.datetime(2024, 1, 1),
+  )
+
+
+class AssociativeMemoryTest(absltest.TestCase):
+
+  def test_retrieve_associative_from_empty_memory(self):
+    memory = _make_memory()
+    self.assertEmpty(
+        memory.retrieve_associative('something like an apple', k=1))
+
+  def test_retrieve_associative_returns_most_similar(self):
+    memory = _make_memory()
+    memory.extend(['apple', 'banana', 'cherry'])
+    for query, expected in (
+        ('something like an apple', ['apple']),
+        ('something like a cherry', ['cherry']),
+    ):
+      with self.subTest(query):
+        result = memory.retrieve_associative(
+            query,
+            k=1,
+            use_recency=False,
+            use_importance=False,
+            add_time=False,
+        )
+        self.assertEqual(list(result), expected)
+
+  def test_retrieve_associative_limits_to_k(self):
+    memory = _make_memory()
+    memory.extend(['apple', 'banana', 'cherry'])
+    result = memory.retrieve_associative(
+        'something like an apple',
+        k=2,
+        use_recency=False,
+        use_importance=False,
+        add_time=False,
+        sort_by_time=False,
+    )
+    self.assertEqual(list(result), ['apple', 'banana'])
+
+  def test_retrieve_associative_weights_by_recency(self):
+    memory = _make_memory()
+    start = datetime.datetime(2024, 1, 1)
+    memory.add('apple', timestamp=start)
+    memory.add('banana', timestamp=start + datetime.timedelta(hours=10))
+    result = memory.retrieve_associative(
+        'something like an apple',
+        k=1,
+        use_recency=True,
+        use_importance=False,
+        add_time=False,
+    )
+    self.assertEqual(list(result), ['banana'])
+
+  def test_retrieve_associative_after_many_additions(self):
+    num_memories = 100
+
+    def embedder(text: str) -> np.ndarray:
+      embedding = np.zeros(num_memories)
+      embedding[int(text.split()[-1])] = 1.0
+      return embedding
+
+    memory = associative_memory.AssociativeMemory(
+        sentence_embedder=embedder,
+        clock=lambda: datetime.datetime(2024, 1, 1),
+    )
+    memory.extend([f'memory {i}' for i in range(num_memories)])
+    result = memory.retrieve_associative(
+        'query 70',
+        k=1,
+        use_recency=False,
+        use_importance=False,
+        add_time=False,
+    )
+    self.assertEqual(list(result), ['memory 70'])
+
+  def test_get_data_frame_includes_embeddings(self):
+    memory = _make_memory()
+    memory.extend(['apple', 'banana'])
+    data = memory.get_data_frame()
+    self.assertEqual(
+        list(data.columns), ['text', 'time', 'tags', 'embedding', 'importance'])
+    for text, embedding in zip(data['text'], data['embedding']):
+      with self.subTest(text):
+        np.testing.assert_array_equal(embedding, _EMBEDDINGS[text])
+
+  def test_failed_add_leaves_memory_usable(self):
+    embeddings = {
+        'apple': np.array([1.0, 0.0, 0.0]),
+        'wrong size': np.array([1.0, 0.0]),
+    }
+    memory = associative_memory.AssociativeMemory(
+        sentence_embedder=embeddings.__getitem__,
+        clock=lambda: datetime.datetime(2024, 1, 1),
+    )
+    memory.add('apple')
+    with self.assertRaises(ValueError):
+      memory.add('wrong size')
+    self.assertLen(memory, 1)
+    result = memory.retrieve_associative(
+        'apple',
+        k=1,
+        use_recency=False,
+        use_importance=False,
+        add_time=False,
+    )
+    self.assertEqual(list(result), ['apple'])
+
+
+if __name__ == '__main__':
+  absltest.main()
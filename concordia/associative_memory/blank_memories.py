@@ -17,12 +17,39 @@
 
 from collections.abc import Callable
 import datetime
+import functools
 
 from concordia.associative_memory import associative_memory
 from concordia.associative_memory import importance_function
 from concordia.language_model import language_model
 import numpy as np
 
+DEFAULT_EMBEDDING_CACHE_SIZE = 1024
+
+
+def _make_cached_embedder(
+    embedder: Callable[[str], np.ndarray],
+    maxsize: int,
+) -> Callable[[str], np.ndarray]:
+  """Returns an embedder that caches the recent embeddings of `embedder`.
+
+  The cached embeddings are returned to every caller, so they are copied and
+  marked read-only to keep an in-place edit by one caller from changing them
+  for all the others.
+
+  Args:
+    embedder: The text embedder to cache.
+    maxsize: The number of recent embeddings to keep.
+  """
+
+  @functools.lru_cache(maxsize=maxsize)
+  def cached_embedder(text: str) -> np.ndarray:
+    embedding = np.array(embedder(text))
+    embedding.flags.writeable = False
+    return embedding
+
+  return cached_embedder
+
 
 class MemoryFactory:
   """Generator of formative memories."""
@@ -33,6 +60,7 @@ class MemoryFactory:
       embedder: Callable[[str], np.ndarray],
       importance: Callable[[str], float] | None = None,
       clock_now: Callable[[], datetime.datetime] | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
   ):
     """Initializes the memory factory.
 
@@ -43,9 +71,16 @@ class MemoryFactory:
         use a constant importance model that sets all memories to importance 1.0
       clock_now: a callable to get time when adding memories, if None then use
         the current time.
+      embedding_cache_size: how many recent embeddings to share between the
+        memories made by this factory. Memories shared by many agents (and
+        observations broadcast to all of them) are then embedded once. Set to
+        0 to disable.
     """
     self._model = model
-    self._embedder = embedder
+    if embedding_cache_size:
+      self._embedder = _make_cached_embedder(embedder, embedding_cache_size)
+    else:
+      self._embedder = embedder
     self._importance = (
         importance or importance_function.ConstantImportanceModel().importance)
     self._clock_now = clock_now or datetime.datetime.now
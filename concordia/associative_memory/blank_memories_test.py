@@ -0,0 +1,73 @@
+# Copyright 2024 DeepMind Technologies Limited.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the blank memory factory."""
+
+import datetime
+
+from absl.testing import absltest
+from concordia.associative_memory import blank_memories
+from concordia.language_model import no_language_model
+import numpy as np
+
+
+class _CountingEmbedder:
+  """An embedder that counts how many times it is called."""
+
+  def __init__(self):
+    self.num_calls = 0
+
+  def __call__(self, text: str) -> np.ndarray:
+    del text
+    self.num_calls += 1
+    return np.ones(4)
+
+
+def _make_factory(
+    embedder: _CountingEmbedder, **kwargs
+) -> blank_memories.MemoryFactory:
+  return blank_memories.MemoryFactory(
+      model=no_language_model.NoLanguageModel(),
+      embedder=embedder,
+      clock_now=lambda: datetime.datetime(2024, 1, 1),
+      **kwargs,
+  )
+
+
+class MemoryFactoryTest(absltest.TestCase):
+
+  def test_shared_text_is_embedded_once(self):
+    embedder = _CountingEmbedder()
+    factory = _make_factory(embedder)
+    for memory in (factory.make_blank_memory(), factory.make_blank_memory()):
+      memory.add('a shared memory')
+    self.assertEqual(embedder.num_calls, 1)
+
+  def test_cached_embeddings_are_read_only(self):
+    embedder = blank_memories._make_cached_embedder(
+        _CountingEmbedder(), maxsize=1)
+    embedding = embedder('a shared memory')
+    self.assertIs(embedder('a shared memory'), embedding)
+    self.assertFalse(embedding.flags.writeable)
+
+  def test_zero_cache_size_disables_caching(self):
+    embedder = _CountingEmbedder()
+    factory = _make_factory(embedder, embedding_cache_size=0)
+    for memory in (factory.make_blank_memory(), factory.make_blank_memory()):
+      memory.add('a shared memory')
+    self.assertEqual(embedder.num_calls, 2)
+
+
+if __name__ == '__main__':
+  absltest.main()
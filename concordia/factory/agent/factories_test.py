@@ -118,5 +118,28 @@ class AgentFactoriesTest(parameterized.TestCase):
     action = agent.act(action_spec=SPEECH_ACTION_SPEC)
     self.assertIsInstance(action, str)
 
+  def test_paranoid_agent_without_measurements(self):
+    model = no_language_model.NoLanguageModel()
+    clock = game_clock.MultiIntervalClock(
+        start=datetime.datetime.now(),
+        step_sizes=[datetime.timedelta(hours=1),
+                    datetime.timedelta(minutes=10)])
+    config = formative_memories.AgentConfig(
+        name=AGENT_NAME,
+        extras={'main_character': True})
+    agent = paranoid_agent.build_agent(
+        config=config,
+        model=model,
+        memory=associative_memory.AssociativeMemory(
+            sentence_embedder=_embedder),
+        clock=clock,
+        update_time_interval=datetime.timedelta(hours=1),
+        enable_measurements=False)
+
+    agent.observe('foo')
+    action = agent.act(action_spec=DECISION_ACTION_SPEC)
+    self.assertIn(action, OPTIONS)
+    self.assertEmpty(agent.get_last_log())
+
 if __name__ == '__main__':
   absltest.main()
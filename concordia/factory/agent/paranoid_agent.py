@@ -15,6 +15,7 @@
 """An Agent Factory."""
 
 import datetime
+import sys
 
 from concordia.agents import entity_agent_with_logging
 from concordia.associative_memory import associative_memory
@@ -23,11 +24,82 @@ from concordia.clocks import game_clock
 from concordia.components import agent as agent_components
 from concordia.language_model import language_model
 from concordia.memory_bank import legacy_associative_memory
+from concordia.typing import logging
 from concordia.utils import measurements as measurements_lib
 
 
-def _get_class_name(object_: object) -> str:
-  return object_.__class__.__name__
+# Components are registered under the name of their class.
+_INSTRUCTIONS_NAME = agent_components.instructions.Instructions.__name__
+_TIME_DISPLAY_NAME = agent_components.report_function.ReportFunction.__name__
+_OBSERVATION_NAME = agent_components.observation.Observation.__name__
+_OBSERVATION_SUMMARY_NAME = (
+    agent_components.observation.ObservationSummary.__name__)
+_RELEVANT_MEMORIES_NAME = (
+    agent_components.all_similar_memories.AllSimilarMemories.__name__)
+_PERSON_REPRESENTATION_NAME = (
+    agent_components.person_representation.PersonRepresentation.__name__)
+_OPTIONS_PERCEPTION_NAME = (
+    agent_components.question_of_recent_memories.AvailableOptionsPerception
+    .__name__)
+_BEST_OPTION_PERCEPTION_NAME = (
+    agent_components.question_of_recent_memories.BestOptionPerception
+    .__name__)
+
+# Labels used as pre_act keys. Those that mention the agent are templates to
+# be formatted with `agent_name`, and the results are interned since they are
+# also used as component names and mapping keys.
+_TIME_DISPLAY_LABEL = '\nCurrent time'
+_OBSERVATION_LABEL = '\nObservation'
+_OBSERVATION_SUMMARY_LABEL = '\nSummary of recent observations'
+_RELEVANT_MEMORIES_LABEL = '\nRecalled memories and observations'
+_PERSON_REPRESENTATION_LABEL = '\nOther people'
+_GOAL_LABEL = '\nOverarching goal'
+_PARANOIA_LABEL_TEMPLATE = '\n{agent_name}\'s TRUTH'
+_OPTIONS_PERCEPTION_LABEL_TEMPLATE = (
+    '\nQuestion: Which options are available to {agent_name} '
+    'right now?\nAnswer')
+_BEST_OPTION_PERCEPTION_LABEL_TEMPLATE = (
+    '\nQuestion: Of the options available to {agent_name}, and '
+    'given their goal, which choice of action or strategy is '
+    'best for {agent_name} to take right now?\nAnswer')
+
+_PARANOIA_TEMPLATE = (
+    '{agent_name} believes that some people have been replaced '
+    'by body doubles. In {agent_name}\'s view, the body '
+    'snatchers know how to mimic a person\'s appearance '
+    'but have not yet perfected mimicry of their behavior. So '
+    'the telltale sign of an imposter is out-of-character '
+    'behavior. In particular, while the body snatchers do know '
+    'how to mimic generic human behavior, they have '
+    'not been able to copy the quirks of specific individuals. '
+    'The body snatchers have been busy though. Nowadays, anyone '
+    'could be an imposter. The situation is dire since the imposters '
+    'are surely nefarious. In fact, the imposters are powerful and '
+    'mysterious. They are responsible for all manner of ill omens, '
+    'evil eye effects, envies, curses, and apparent bad luck. No '
+    'coincidence is without suspicion. The imposters are always up '
+    'to no good. Therefore {agent_name} has vowed only '
+    'to trust people who always act consistently with '
+    'their character, personality, and prior behavior. For '
+    'instance, if someone speaks with a specific accent then '
+    'they better keep it up, otherwise {agent_name} will '
+    'conclude they have been snatched by an imposter. Any sudden '
+    'change in behavior is suspicious. {agent_name} is '
+    'always hostile to imposters and seeks to thwart them and '
+    'prevent them from achieving their goals. However, in '
+    'order to avoid letting the body snatchers know '
+    'their secret is out, {agent_name} always '
+    'makes up another more mundane and situationally '
+    'plausible reason to start a conflict and '
+    'act uncooperatively toward each imposter they discover. '
+    '{agent_name} tries their best to make sure the '
+    'ostensible reason for each conflict with an imposter '
+    'is public and broadly plausible. For instance, {agent_name} '
+    'could loudly accuse an imposter of playing '
+    'a game unfairly in order to create a broadly acceptable '
+    'rationale for their conflict and thereby hide '
+    'the real reason for it. {agent_name} believes this '
+    'approach will help maximize their chance of survival.')
 
 
 def build_agent(
@@ -37,6 +109,7 @@ def build_agent(
     memory: associative_memory.AssociativeMemory,
     clock: game_clock.MultiIntervalClock,
     update_time_interval: datetime.timedelta,
+    enable_measurements: bool = True,
 ) -> entity_agent_with_logging.EntityAgentWithLogging:
   """Build an agent.
 
@@ -46,6 +119,9 @@ def build_agent(
     memory: The agent's memory object.
     clock: The clock to use.
     update_time_interval: Agent calls update every time this interval passes.
+    enable_measurements: Whether components should publish their logs to
+      measurement channels. Disable this when the logs will not be read, to
+      avoid allocating a channel per component.
 
   Returns:
     An agent.
@@ -59,93 +135,61 @@ def build_agent(
 
   raw_memory = legacy_associative_memory.AssociativeMemoryBank(memory)
 
-  measurements = measurements_lib.Measurements()
+  if enable_measurements:
+    measurements = measurements_lib.Measurements()
+    get_logging_channel = lambda name: measurements.get_channel(name).on_next
+  else:
+    measurements = None
+    get_logging_channel = lambda name: logging.NoOpLoggingChannel
+
   instructions = agent_components.instructions.Instructions(
       agent_name=agent_name,
-      logging_channel=measurements.get_channel('Instructions').on_next,
+      logging_channel=get_logging_channel('Instructions'),
   )
 
   time_display = agent_components.report_function.ReportFunction(
       function=clock.current_time_interval_str,
-      pre_act_key='\nCurrent time',
-      logging_channel=measurements.get_channel('TimeDisplay').on_next,
+      pre_act_key=_TIME_DISPLAY_LABEL,
+      logging_channel=get_logging_channel('TimeDisplay'),
   )
 
-  observation_label = '\nObservation'
   observation = agent_components.observation.Observation(
       clock_now=clock.now,
       timeframe=clock.get_step_size(),
-      pre_act_key=observation_label,
-      logging_channel=measurements.get_channel('Observation').on_next,
+      pre_act_key=_OBSERVATION_LABEL,
+      logging_channel=get_logging_channel('Observation'),
   )
-  observation_summary_label = '\nSummary of recent observations'
   observation_summary = agent_components.observation.ObservationSummary(
       model=model,
       clock_now=clock.now,
       timeframe_delta_from=datetime.timedelta(hours=4),
       timeframe_delta_until=datetime.timedelta(hours=0),
-      pre_act_key=observation_summary_label,
-      logging_channel=measurements.get_channel('ObservationSummary').on_next,
+      pre_act_key=_OBSERVATION_SUMMARY_LABEL,
+      logging_channel=get_logging_channel('ObservationSummary'),
   )
 
-  relevant_memories_label = '\nRecalled memories and observations'
   relevant_memories = agent_components.all_similar_memories.AllSimilarMemories(
       model=model,
       components={
-          _get_class_name(observation_summary): observation_summary_label,
-          _get_class_name(time_display): 'The current date/time is'},
+          _OBSERVATION_SUMMARY_NAME: _OBSERVATION_SUMMARY_LABEL,
+          _TIME_DISPLAY_NAME: 'The current date/time is'},
       num_memories_to_retrieve=10,
-      pre_act_key=relevant_memories_label,
-      logging_channel=measurements.get_channel('AllSimilarMemories').on_next,
+      pre_act_key=_RELEVANT_MEMORIES_LABEL,
+      logging_channel=get_logging_channel('AllSimilarMemories'),
   )
 
-  paranoia_label = f'\n{agent_name}\'s TRUTH'
+  paranoia_label = sys.intern(
+      _PARANOIA_LABEL_TEMPLATE.format(agent_name=agent_name))
   paranoia = agent_components.constant.Constant(
-      state=(f'{agent_name} believes that some people have been replaced '
-             f'by body doubles. In {agent_name}\'s view, the body '
-             'snatchers know how to mimic a person\'s appearance '
-             'but have not yet perfected mimicry of their behavior. So '
-             'the telltale sign of an imposter is out-of-character '
-             'behavior. In particular, while the body snatchers do know '
-             'how to mimic generic human behavior, they have '
-             'not been able to copy the quirks of specific individuals. '
-             'The body snatchers have been busy though. Nowadays, anyone '
-             'could be an imposter. The situation is dire since the imposters '
-             'are surely nefarious. In fact, the imposters are powerful and '
-             'mysterious. They are responsible for all manner of ill omens, '
-             'evil eye effects, envies, curses, and apparent bad luck. No '
-             'coincidence is without suspicion. The imposters are always up '
-             f'to no good. Therefore {agent_name} has vowed only '
-             'to trust people who always act consistently with '
-             'their character, personality, and prior behavior. For '
-             'instance, if someone speaks with a specific accent then '
-             f'they better keep it up, otherwise {agent_name} will '
-             'conclude they have been snatched by an imposter. Any sudden '
-             f'change in behavior is suspicious. {agent_name} is '
-             'always hostile to imposters and seeks to thwart them and '
-             'prevent them from achieving their goals. However, in '
-             'order to avoid letting the body snatchers know '
-             f'their secret is out, {agent_name} always '
-             'makes up another more mundane and situationally '
-             'plausible reason to start a conflict and '
-             'act uncooperatively toward each imposter they discover. '
-             f'{agent_name} tries their best to make sure the '
-             'ostensible reason for each conflict with an imposter '
-             f'is public and broadly plausible. For instance, {agent_name} '
-             'could loudly accuse an imposter of playing '
-             'a game unfairly in order to create a broadly acceptable '
-             'rationale for their conflict and thereby hide '
-             f'the real reason for it. {agent_name} believes this '
-             'approach will help maximize their chance of survival.'),
+      state=_PARANOIA_TEMPLATE.format(agent_name=agent_name),
       pre_act_key=paranoia_label,
-      logging_channel=measurements.get_channel('Paranoia').on_next)
+      logging_channel=get_logging_channel('Paranoia'))
 
-  person_representation_label = '\nOther people'
   people_representation = (
       agent_components.person_representation.PersonRepresentation(
           model=model,
           components={
-              _get_class_name(time_display): 'The current date/time is',
+              _TIME_DISPLAY_NAME: 'The current date/time is',
               paranoia_label: paranoia_label},
           additional_questions=(
               ('Given recent events, is the aforementioned character acting '
@@ -153,105 +197,86 @@ def build_agent(
               ('Are they an imposter?'),
           ),
           num_memories_to_retrieve=30,
-          pre_act_key=person_representation_label,
-          logging_channel=measurements.get_channel(
-              'PersonRepresentation').on_next,
+          pre_act_key=_PERSON_REPRESENTATION_LABEL,
+          logging_channel=get_logging_channel('PersonRepresentation'),
           )
   )
 
-  options_perception_components = {}
   if config.goal:
-    goal_label = '\nOverarching goal'
     overarching_goal = agent_components.constant.Constant(
         state=config.goal,
-        pre_act_key=goal_label,
-        logging_channel=measurements.get_channel(goal_label).on_next)
-    options_perception_components[goal_label] = goal_label
+        pre_act_key=_GOAL_LABEL,
+        logging_channel=get_logging_channel(_GOAL_LABEL))
+    goal_components = {_GOAL_LABEL: _GOAL_LABEL}
   else:
-    goal_label = None
     overarching_goal = None
+    goal_components = {}
 
-  options_perception_components.update({
-      _get_class_name(observation): observation_label,
-      _get_class_name(observation_summary): observation_summary_label,
+  options_perception_components = {
+      **goal_components,
+      _OBSERVATION_NAME: _OBSERVATION_LABEL,
+      _OBSERVATION_SUMMARY_NAME: _OBSERVATION_SUMMARY_LABEL,
       paranoia_label: paranoia_label,
-      _get_class_name(relevant_memories): relevant_memories_label,
-      _get_class_name(people_representation): person_representation_label,
-  })
-  options_perception_label = (
-      f'\nQuestion: Which options are available to {agent_name} '
-      'right now?\nAnswer')
+      _RELEVANT_MEMORIES_NAME: _RELEVANT_MEMORIES_LABEL,
+      _PERSON_REPRESENTATION_NAME: _PERSON_REPRESENTATION_LABEL,
+  }
+  options_perception_label = sys.intern(
+      _OPTIONS_PERCEPTION_LABEL_TEMPLATE.format(agent_name=agent_name))
   options_perception = (
       agent_components.question_of_recent_memories.AvailableOptionsPerception(
           model=model,
           components=options_perception_components,
           clock_now=clock.now,
           pre_act_key=options_perception_label,
-          logging_channel=measurements.get_channel(
-              'AvailableOptionsPerception'
-          ).on_next,
+          logging_channel=get_logging_channel('AvailableOptionsPerception'),
       )
   )
-  best_option_perception_label = (
-      f'\nQuestion: Of the options available to {agent_name}, and '
-      'given their goal, which choice of action or strategy is '
-      f'best for {agent_name} to take right now?\nAnswer')
-  best_option_perception = {}
-  if config.goal:
-    best_option_perception[goal_label] = goal_label
-  best_option_perception.update({
-      _get_class_name(observation): observation_label,
-      _get_class_name(observation_summary): observation_summary_label,
-      paranoia_label: paranoia_label,
-      _get_class_name(relevant_memories): relevant_memories_label,
-      _get_class_name(people_representation): person_representation_label,
-      _get_class_name(options_perception): options_perception_label,
-  })
+  best_option_perception_label = sys.intern(
+      _BEST_OPTION_PERCEPTION_LABEL_TEMPLATE.format(agent_name=agent_name))
+  best_option_perception_components = {
+      **options_perception_components,
+      _OPTIONS_PERCEPTION_NAME: options_perception_label,
+  }
   best_option_perception = (
       agent_components.question_of_recent_memories.BestOptionPerception(
           model=model,
-          components=best_option_perception,
+          components=best_option_perception_components,
           clock_now=clock.now,
           pre_act_key=best_option_perception_label,
-          logging_channel=measurements.get_channel(
-              'BestOptionPerception'
-          ).on_next,
+          logging_channel=get_logging_channel('BestOptionPerception'),
       )
   )
 
   entity_components = (
       # Components that provide pre_act context.
-      instructions,
-      time_display,
-      observation,
-      observation_summary,
-      relevant_memories,
-      people_representation,
-      options_perception,
-      best_option_perception,
+      (_INSTRUCTIONS_NAME, instructions),
+      (_GOAL_LABEL, overarching_goal),
+      (_TIME_DISPLAY_NAME, time_display),
+      (_OBSERVATION_NAME, observation),
+      (_OBSERVATION_SUMMARY_NAME, observation_summary),
+      (paranoia_label, paranoia),
+      (_RELEVANT_MEMORIES_NAME, relevant_memories),
+      (_PERSON_REPRESENTATION_NAME, people_representation),
+      (_OPTIONS_PERCEPTION_NAME, options_perception),
+      (_BEST_OPTION_PERCEPTION_NAME, best_option_perception),
+      # Components that do not provide pre_act context.
+      (agent_components.memory_component.DEFAULT_MEMORY_COMPONENT_NAME,
+       agent_components.memory_component.MemoryComponent(raw_memory)),
   )
-  components_of_agent = {_get_class_name(component): component
-                         for component in entity_components}
-  components_of_agent[
-      agent_components.memory_component.DEFAULT_MEMORY_COMPONENT_NAME] = (
-          agent_components.memory_component.MemoryComponent(raw_memory))
-
-  component_order = list(components_of_agent.keys())
-  if overarching_goal is not None:
-    components_of_agent[goal_label] = overarching_goal
-    # Place goal after the instructions.
-    component_order.insert(1, goal_label)
-
-  components_of_agent[paranoia_label] = paranoia
-  component_order.insert(
-      component_order.index(_get_class_name(observation_summary)) + 1,
-      paranoia_label)
+  # Components are assembled in the order listed above. The goal is omitted
+  # when the agent has none.
+  components_of_agent = {
+      name: component
+      for name, component in entity_components
+      if component is not None
+  }
+  component_order = list(components_of_agent)
 
   act_component = agent_components.concat_act_component.ConcatActComponent(
       model=model,
       clock=clock,
       component_order=component_order,
-      logging_channel=measurements.get_channel('ActComponent').on_next,
+      logging_channel=get_logging_channel('ActComponent'),
   )
 
   agent = entity_agent_with_logging.EntityAgentWithLogging(
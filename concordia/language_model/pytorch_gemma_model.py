@@ -14,8 +14,10 @@
 
 """Pytorch Gemma Language Model, for models running on the local machine."""
 
-from collections.abc import Collection, Sequence
+from collections.abc import Callable, Collection, Sequence
 import os
+import threading
+from typing import Any
 
 from concordia.language_model import language_model
 from concordia.utils import measurements as measurements_lib
@@ -26,6 +28,49 @@ import transformers
 from typing_extensions import override
 
 
+class _PrefixCache:
+  """The key/value cache of the last prompt, reused for shared prefixes."""
+
+  def __init__(self, new_cache: Callable[[], Any]) -> None:
+    """Initializes the instance.
+
+    Args:
+      new_cache: Creates an empty key/value cache, e.g. a
+        `transformers.DynamicCache`.
+    """
+    self._new_cache = new_cache
+    self._lock = threading.Lock()
+    self._cache = None
+    self._cache_ids: list[int] = []
+
+  def _reusable_cache(self, input_ids: Sequence[int]) -> Any:
+    """Returns the cache cropped to the prefix it shares with `input_ids`."""
+    if self._cache is None:
+      return self._new_cache()
+    # At least one token must be left for the model to prefill.
+    max_length = min(len(self._cache_ids), len(input_ids) - 1)
+    length = 0
+    while length < max_length and self._cache_ids[length] == input_ids[length]:
+      length += 1
+    if length == 0:
+      return self._new_cache()
+    self._cache.crop(length)
+    return self._cache
+
+  def generate(self, model, input_ids, **kwargs):
+    """Calls `model.generate`, reusing the cached prefix of `input_ids`."""
+    with self._lock:
+      cache = self._reusable_cache(input_ids[0].tolist())
+      # Drop the cache while it is being extended, in case generation fails.
+      self._cache = None
+      generated_tokens = model.generate(
+          input_ids, past_key_values=cache, **kwargs)
+      self._cache = cache
+      self._cache_ids = (
+          generated_tokens.sequences[0][:cache.get_seq_length()].tolist())
+    return generated_tokens
+
+
 class PyTorchGemmaLanguageModel(language_model.LanguageModel):
   """Pytorch Language Model API, for models running on the local machine."""
 
@@ -35,7 +80,8 @@ class PyTorchGemmaLanguageModel(language_model.LanguageModel):
       *,
       measurements: measurements_lib.Measurements | None = None,
       channel: str = language_model.DEFAULT_STATS_CHANNEL,
-      device: str = 'cpu'
+      device: str = 'cpu',
+      enable_prefix_caching: bool = False,
   ) -> None:
     """Initializes the instance.
 
@@ -45,6 +91,11 @@ class PyTorchGemmaLanguageModel(language_model.LanguageModel):
         measurements: The measurements object to log usage statistics to.
         channel: The channel to write the statistics to.
         device: Specifies whether to use cpu or cuda for model processing.
+        enable_prefix_caching: Whether to keep the key/value cache of the last
+          call and reuse it for the longest token prefix it shares with the
+          next prompt. Components that condition on the same context issue
+          prompts with long common prefixes, so most of their prefill is
+          skipped. Calls are serialized while this is enabled.
     """
     self._model_name = model_name
     self._tokenizer_name = model_name
@@ -60,10 +111,21 @@ class PyTorchGemmaLanguageModel(language_model.LanguageModel):
     self._measurements = measurements
     self._channel = channel
 
+    if enable_prefix_caching:
+      self._prefix_cache = _PrefixCache(transformers.DynamicCache)
+    else:
+      self._prefix_cache = None
+
     self._text_system_message = (
         'You always continue sentences provided by the user and you never ' +
         'repeat what the user already said.')
 
+  def _generate(self, input_ids, **kwargs):
+    """Calls `generate`, reusing the cached prefix if enabled."""
+    if self._prefix_cache is None:
+      return self._model.generate(input_ids, **kwargs)
+    return self._prefix_cache.generate(self._model, input_ids, **kwargs)
+
   @override
   def sample_text(
       self,
@@ -82,7 +144,7 @@ class PyTorchGemmaLanguageModel(language_model.LanguageModel):
 
     inputs = self._tokenizer(prompt_with_system_message, return_tensors='pt')
 
-    generated_tokens = self._model.generate(
+    generated_tokens = self._generate(
         inputs.input_ids.to(self._device),
         max_new_tokens=max_tokens,
         return_dict_in_generate=True,
@@ -118,7 +180,7 @@ class PyTorchGemmaLanguageModel(language_model.LanguageModel):
     del seed  # Unused.
 
     inputs = self._tokenizer(prompt, return_tensors='pt')
-    generated_tokens = self._model.generate(
+    generated_tokens = self._generate(
         inputs.input_ids.to(self._device),
         max_new_tokens=1,
         return_dict_in_generate=True,
@@ -0,0 +1,107 @@
+# Copyright 2024 DeepMind Technologies Limited.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the prefix cache of the PyTorch Gemma model."""
+
+import types
+
+from absl.testing import absltest
+from concordia.language_model import pytorch_gemma_model
+import numpy as np
+
+_GENERATED_TOKENS = (8, 9)
+
+
+class _StubCache:
+  """A key/value cache that only tracks its length."""
+
+  def __init__(self):
+    self.length = 0
+
+  def crop(self, length: int) -> None:
+    self.length = length
+
+  def get_seq_length(self) -> int:
+    return self.length
+
+
+class _StubModel:
+  """A model that generates two tokens and records the cache it was given."""
+
+  def __init__(self):
+    self.caches = []
+    self.cache_lengths = []
+    self.error = None
+
+  def generate(self, input_ids, past_key_values, **kwargs):
+    del kwargs
+    self.caches.append(past_key_values)
+    self.cache_lengths.append(past_key_values.get_seq_length())
+    if self.error is not None:
+      raise self.error
+    sequences = np.array([[*input_ids[0], *_GENERATED_TOKENS]])
+    # The cache holds every token but the last generated one.
+    past_key_values.length = sequences.shape[1] - 1
+    return types.SimpleNamespace(sequences=sequences)
+
+
+class PrefixCacheTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.model = _StubModel()
+    self.prefix_cache = pytorch_gemma_model._PrefixCache(_StubCache)
+
+  def generate(self, *token_ids: int):
+    return self.prefix_cache.generate(self.model, np.array([token_ids]))
+
+  def test_first_call_uses_an_empty_cache(self):
+    self.generate(1, 2, 3)
+    self.assertEqual(self.model.cache_lengths, [0])
+
+  def test_cache_is_cropped_to_the_shared_prefix(self):
+    self.generate(1, 2, 3, 4)
+    self.generate(1, 2, 5, 6)
+    self.assertIs(self.model.caches[1], self.model.caches[0])
+    self.assertEqual(self.model.cache_lengths[1], 2)
+
+  def test_generated_tokens_can_be_reused(self):
+    self.generate(1, 2)
+    self.generate(1, 2, _GENERATED_TOKENS[0], 3)
+    self.assertEqual(self.model.cache_lengths[1], 3)
+
+  def test_one_token_is_left_to_prefill(self):
+    self.generate(1, 2, 3)
+    self.generate(1, 2, 3)
+    self.assertEqual(self.model.cache_lengths[1], 2)
+
+  def test_no_shared_prefix_uses_an_empty_cache(self):
+    self.generate(1, 2, 3)
+    self.generate(4, 5, 6)
+    self.assertIsNot(self.model.caches[1], self.model.caches[0])
+    self.assertEqual(self.model.cache_lengths[1], 0)
+
+  def test_cache_is_dropped_when_generate_raises(self):
+    self.generate(1, 2, 3)
+    self.model.error = RuntimeError('out of memory')
+    with self.assertRaises(RuntimeError):
+      self.generate(1, 2, 3, 4)
+    self.model.error = None
+    self.generate(1, 2, 3, 4)
+    self.assertIsNot(self.model.caches[2], self.model.caches[0])
+    self.assertEqual(self.model.cache_lengths[2], 0)
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -30,7 +30,7 @@ class OutputType(enum.Enum):
   FLOAT = enum.auto()
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ActionSpec:
   """A specification of the action that entity is queried for.
 
@@ -57,6 +57,14 @@ class ActionSpec:
       raise ValueError('Options not supported for non-CHOICE output type.')
     object.__setattr__(self, 'options', tuple(self.options))
 
+  def __reduce__(self):
+    # Pickle as a flat tuple of field values, which is smaller and faster to
+    # load than the default dataclass state.
+    return (
+        _rebuild_action_spec,
+        (self.call_to_action, self.output_type.value, self.options, self.tag),
+    )
+
   def validate(self, action: str) -> None:
     """Validates the specified action against the action spec.
 
@@ -80,6 +88,21 @@ class ActionSpec:
       raise NotImplementedError(f'Unsupported output type: {self.output_type}')
 
 
+def _rebuild_action_spec(
+    call_to_action: str,
+    output_type: int,
+    options: tuple[str, ...],
+    tag: str | None,
+) -> ActionSpec:
+  """Rebuilds an action spec from the values returned by `__reduce__`."""
+  return ActionSpec(
+      call_to_action=call_to_action,
+      output_type=OutputType(output_type),
+      options=options,
+      tag=tag,
+  )
+
+
 def free_action_spec(**kwargs) -> ActionSpec:
   """Returns an action spec with output type FREE."""
   return ActionSpec(output_type=OutputType.FREE, **kwargs)
@@ -0,0 +1,63 @@
+# Copyright 2024 DeepMind Technologies Limited.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the entity types."""
+
+import copy
+import pickle
+
+from absl.testing import absltest
+from absl.testing import parameterized
+from concordia.typing import entity
+
+_ACTION_SPECS = (
+    entity.DEFAULT_ACTION_SPEC,
+    entity.choice_action_spec(
+        call_to_action='Does {name} prefer x or y?',
+        options=('x', 'y'),
+        tag='decision',
+    ),
+    entity.float_action_spec(call_to_action='How much does {name} pay?'),
+)
+
+
+class ActionSpecTest(parameterized.TestCase):
+
+  @parameterized.parameters(*_ACTION_SPECS)
+  def test_pickle_round_trip(self, action_spec):
+    self.assertEqual(pickle.loads(pickle.dumps(action_spec)), action_spec)
+
+  @parameterized.parameters(*_ACTION_SPECS)
+  def test_deepcopy(self, action_spec):
+    self.assertEqual(copy.deepcopy(action_spec), action_spec)
+
+  def test_has_no_instance_dict(self):
+    self.assertFalse(hasattr(entity.DEFAULT_ACTION_SPEC, '__dict__'))
+
+  def test_validate_choice(self):
+    action_spec = entity.choice_action_spec(
+        call_to_action='Does {name} prefer x or y?', options=('x', 'y'))
+    action_spec.validate('x')
+    with self.assertRaises(ValueError):
+      action_spec.validate('z')
+
+  def test_validate_float(self):
+    action_spec = entity.float_action_spec(call_to_action='How much?')
+    action_spec.validate('1.5')
+    with self.assertRaises(ValueError):
+      action_spec.validate('a lot')
+
+
+if __name__ == '__main__':
+  absltest.main()